@@ -20,6 +20,8 @@ class Settings(BaseSettings):
 
     # Cache settings
     cache_ttl_seconds: int = 3600  # 1 hour
+    # Redis URL for the cache shared between workers (disabled if empty)
+    redis_url: str = ""
 
 
 settings = Settings()
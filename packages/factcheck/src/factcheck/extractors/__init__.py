@@ -1,5 +1,6 @@
 """Claim extractors package."""
 
+from .cache import ExtractionCache
 from .patterns import PatternExtractor
 
-__all__ = ["PatternExtractor"]
+__all__ = ["ExtractionCache", "PatternExtractor"]
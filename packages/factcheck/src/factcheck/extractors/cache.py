@@ -0,0 +1,72 @@
+"""TTL cache for claim extraction results."""
+
+import hashlib
+import threading
+from typing import TYPE_CHECKING
+
+from cachetools import TTLCache
+
+from ..config import settings
+
+if TYPE_CHECKING:
+    from ..models import Claim
+
+
+class ExtractionCache:
+    """In-memory TTL cache for claims extracted from a text.
+
+    Safe to share between threads, since sync endpoints run in a threadpool.
+    """
+
+    def __init__(self, maxsize: int = 1000, ttl: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of items in the cache
+            ttl: Time-to-live in seconds (defaults to config setting)
+        """
+        self._cache: TTLCache[bytes, list[Claim]] = TTLCache(
+            maxsize=maxsize,
+            ttl=ttl or settings.cache_ttl_seconds,
+        )
+        # TTLCache isn't thread-safe; reads also mutate it by expiring entries
+        self._lock = threading.Lock()
+
+    def _make_key(self, text: str) -> bytes:
+        """Create a cache key from the source text."""
+        # Texts can be up to 50KB, so key on a digest rather than the text itself
+        return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def get(self, text: str) -> "list[Claim] | None":
+        """Get cached claims for a text.
+
+        Args:
+            text: The source text to look up
+
+        Returns:
+            The cached claims or None if not found
+        """
+        key = self._make_key(text)
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, text: str, claims: "list[Claim]") -> None:
+        """Cache the claims extracted from a text.
+
+        Args:
+            text: The source text as key
+            claims: The extracted claims to cache
+        """
+        key = self._make_key(text)
+        with self._lock:
+            self._cache[key] = claims
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        with self._lock:
+            return len(self._cache)
@@ -2,12 +2,19 @@
 
 import re
 import uuid
+from array import array
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..models import Claim, ClaimType, SourceOffset
+from .cache import ExtractionCache
 
+# Characters that terminate a sentence
+_SENTENCE_BOUNDARY = re.compile(r"[.!?\n]")
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PatternMatch:
     """A pattern match result."""
 
@@ -17,56 +24,209 @@ class PatternMatch:
     claim_type: ClaimType
 
 
+@dataclass(slots=True)
+class _RawClaim:
+    """A candidate claim before conversion to the API model."""
+
+    text: str
+    claim_type: ClaimType
+    start: int
+    end: int
+
+
+def _group_name(claim_type: ClaimType, index: int) -> str:
+    """Name of the group wrapping a pattern in the fused alternation."""
+    return f"{claim_type.name}_{index}"
+
+
+def _combine_patterns(
+    patterns: dict[ClaimType, list[re.Pattern[str]]],
+    skip: frozenset[tuple[ClaimType, int]] = frozenset(),
+) -> re.Pattern[str]:
+    """Fuse claim patterns into one alternation so text is scanned once.
+
+    Each pattern is wrapped in a named group ``<CLAIMTYPE>_<index>`` so the
+    claim type can be recovered from ``match.lastgroup``. Patterns whose
+    ``(claim_type, index)`` is in ``skip`` are left out.
+    """
+    alternatives: list[str] = []
+    for claim_type, type_patterns in patterns.items():
+        for index, pattern in enumerate(type_patterns):
+            if (claim_type, index) in skip:
+                continue
+            # Capturing groups would shift lastgroup to the inner group
+            if pattern.groups:
+                raise ValueError(f"Pattern must not contain capturing groups: {pattern.pattern}")
+            # Patterns are matched case-sensitively against lowercased text
+            unescaped = re.sub(r"\\.", "", pattern.pattern)
+            if unescaped != unescaped.lower():
+                raise ValueError(f"Pattern must be lowercase: {pattern.pattern}")
+            alternatives.append(f"(?P<{_group_name(claim_type, index)}>{pattern.pattern})")
+    return re.compile("|".join(alternatives))
+
+
+def _check_required_literals(
+    patterns: dict[ClaimType, list[re.Pattern[str]]],
+    required: dict[tuple[ClaimType, int], tuple[str, ...]],
+) -> dict[tuple[ClaimType, int], tuple[str, ...]]:
+    """Check that each pattern's required literals appear in its source.
+
+    The table is keyed by position in ``patterns``, so a pattern inserted or
+    reordered without updating it would make the prefilter skip the wrong
+    pattern. Returns ``required`` unchanged so it can wrap the table.
+    """
+    for (claim_type, index), literals in required.items():
+        type_patterns = patterns.get(claim_type, [])
+        if index >= len(type_patterns):
+            raise ValueError(f"No pattern for required literals {_group_name(claim_type, index)}")
+        source = type_patterns[index].pattern
+        missing = [literal for literal in literals if literal not in source]
+        if missing:
+            raise ValueError(
+                f"Required literals {missing} not in pattern "
+                f"{_group_name(claim_type, index)}: {source}"
+            )
+    return required
+
+
+def _lower(text: str) -> str:
+    """Lowercase text without changing its length, so offsets stay valid.
+
+    U+0130 (capital I with dot above) is the only character whose lowercase
+    form is two code points; it is mapped to a plain "i" instead.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        lowered = text.replace("\u0130", "i").lower()
+    return lowered
+
+
+def _strip_span(text: str, start: int, end: int) -> tuple[int, int]:
+    """Narrow a span to exclude surrounding whitespace, like str.strip without slicing."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _spans_overlap(start1: int, end1: int, start2: int, end2: int) -> bool:
+    """Check if two text spans have significant overlap."""
+    overlap_len = min(end1, end2) - max(start1, start2)
+    # Significant overlap if more than 50% of either span overlaps
+    return overlap_len > 0 and overlap_len > 0.5 * min(end1 - start1, end2 - start2)
+
+
 class PatternExtractor:
     """Extract claims from text using regex patterns."""
 
-    # Patterns for different claim types
+    # Patterns for different claim types, matched against lowercased text
+    # (lowercase and non-capturing only, see _combine_patterns)
     PATTERNS: dict[ClaimType, list[re.Pattern[str]]] = {
         ClaimType.STATISTICAL: [
             # Percentages: "75% of users", "increased by 50%"
-            re.compile(r"\b(\d+(?:\.\d+)?%)\s*(?:of|increase|decrease|growth|decline)", re.I),
+            re.compile(r"\b(?:\d+(?:\.\d+)?%)\s*(?:of|increase|decrease|growth|decline)"),
             # Numbers with context: "over 1 million users", "approximately 500"
-            re.compile(r"\b(?:over|about|approximately|roughly|nearly|around)\s+(\d[\d,\.]*)\s+\w+", re.I),
+            re.compile(r"\b(?:over|about|approximately|roughly|nearly|around)\s+(?:\d[\d,\.]*)\s+\w+"),
             # Specific numbers: "has 2.5 billion users"
-            re.compile(r"\b(?:has|have|had|with)\s+(\d[\d,\.]*)\s*(?:million|billion|thousand|users|people|customers)", re.I),
+            re.compile(r"\b(?:has|have|had|with)\s+(?:\d[\d,\.]*)\s*(?:million|billion|thousand|users|people|customers)"),
         ],
         ClaimType.TEMPORAL: [
             # Year references: "in 2024", "since 1999"
-            re.compile(r"\b(?:in|since|from|during|by)\s+(\d{4})\b", re.I),
+            re.compile(r"\b(?:in|since|from|during|by)\s+(?:\d{4})\b"),
             # Founded/established dates
-            re.compile(r"\b(?:founded|established|created|launched|started)\s+(?:in\s+)?(\d{4})\b", re.I),
+            re.compile(r"\b(?:founded|established|created|launched|started)\s+(?:in\s+)?(?:\d{4})\b"),
             # Specific dates
-            re.compile(r"\b(?:on|in)\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2}(?:,?\s+\d{4})?\b", re.I),
+            re.compile(r"\b(?:on|in)\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(?:,?\s+\d{4})?\b"),
         ],
         ClaimType.FACTUAL: [
             # Superlatives: "is the first", "is the largest"
-            re.compile(r"\b(?:is|are|was|were)\s+(?:the\s+)?(?:first|largest|smallest|biggest|oldest|newest|most|least|only)\b", re.I),
+            re.compile(r"\b(?:is|are|was|were)\s+(?:the\s+)?(?:first|largest|smallest|biggest|oldest|newest|most|least|only)\b"),
             # Definitive statements: "X is the capital of Y"
-            re.compile(r"\b(?:is|are)\s+(?:the\s+)?(?:capital|founder|CEO|president|inventor|creator)\s+of\b", re.I),
+            re.compile(r"\b(?:is|are)\s+(?:the\s+)?(?:capital|founder|ceo|president|inventor|creator)\s+of\b"),
             # Location claims
-            re.compile(r"\b(?:located|based|headquartered)\s+in\b", re.I),
+            re.compile(r"\b(?:located|based|headquartered)\s+in\b"),
         ],
         ClaimType.ATTRIBUTION: [
             # "According to X", "X said"
-            re.compile(r"\baccording\s+to\s+", re.I),
+            re.compile(r"\baccording\s+to\s+"),
             # Reported by
-            re.compile(r"\b(?:reported|stated|announced|claimed|said)\s+(?:by|that)\b", re.I),
+            re.compile(r"\b(?:reported|stated|announced|claimed|said)\s+(?:by|that)\b"),
             # Research/study references
-            re.compile(r"\b(?:research|study|survey|report)\s+(?:by|from|shows|found)\b", re.I),
+            re.compile(r"\b(?:research|study|survey|report)\s+(?:by|from|shows|found)\b"),
         ],
         ClaimType.COMPARATIVE: [
             # Comparisons: "X is better than Y", "faster than"
-            re.compile(r"\b(?:better|worse|faster|slower|larger|smaller|more|less)\s+than\b", re.I),
+            re.compile(r"\b(?:better|worse|faster|slower|larger|smaller|more|less)\s+than\b"),
             # Rankings
-            re.compile(r"\b(?:ranked|ranks)\s+(?:\#?\d+|first|second|third)\b", re.I),
+            re.compile(r"\b(?:ranked|ranks)\s+(?:\#?\d+|first|second|third)\b"),
             # Outperform/exceed
-            re.compile(r"\b(?:outperforms?|exceeds?|surpasses?)\b", re.I),
+            re.compile(r"\b(?:outperforms?|exceeds?|surpasses?)\b"),
         ],
     }
 
+    # All patterns fused into a single alternation, compiled once at class load
+    COMBINED_PATTERN = _combine_patterns(PATTERNS)
+
+    # Claim type for each group name in the fused alternation
+    GROUP_TYPES: dict[str, ClaimType] = {
+        _group_name(claim_type, index): claim_type
+        for claim_type, type_patterns in PATTERNS.items()
+        for index in range(len(type_patterns))
+    }
+
+    # Position of each group in declaration order. Matches are processed in
+    # this order (as when each pattern was scanned separately), so a sentence
+    # is claimed by the first declared pattern it matches, e.g. a statistical
+    # match on "2.5 million" rather than a temporal one ending at the "2."
+    GROUP_PRIORITY: dict[str, int] = {name: rank for rank, name in enumerate(GROUP_TYPES)}
+
+    # Words (lowercase) of which at least one must appear for a pattern to match.
+    # Patterns whose words are all absent from a text are left out of its scan;
+    # patterns not listed here are always scanned. Keyed by position in PATTERNS
+    # and checked against the pattern sources at class load.
+    REQUIRED_LITERALS: dict[tuple[ClaimType, int], tuple[str, ...]] = _check_required_literals(
+        PATTERNS,
+        {
+            (ClaimType.STATISTICAL, 0): ("%",),
+            (ClaimType.STATISTICAL, 1): (
+                "over", "about", "approximately", "roughly", "nearly", "around",
+            ),
+            (ClaimType.TEMPORAL, 1): ("founded", "established", "created", "launched", "started"),
+            (ClaimType.TEMPORAL, 2): (
+                "january", "february", "march", "april", "may", "june", "july",
+                "august", "september", "october", "november", "december",
+            ),
+            (ClaimType.FACTUAL, 1): (
+                "capital", "founder", "ceo", "president", "inventor", "creator",
+            ),
+            (ClaimType.FACTUAL, 2): ("located", "based", "headquartered"),
+            (ClaimType.ATTRIBUTION, 0): ("according",),
+            (ClaimType.ATTRIBUTION, 1): ("reported", "stated", "announced", "claimed", "said"),
+            (ClaimType.ATTRIBUTION, 2): ("research", "study", "survey", "report"),
+            (ClaimType.COMPARATIVE, 0): ("than",),
+            (ClaimType.COMPARATIVE, 1): ("rank",),
+            (ClaimType.COMPARATIVE, 2): ("outperform", "exceed", "surpass"),
+        },
+    )
+
     # Base confidence for pattern matching (can be adjusted by context)
     BASE_CONFIDENCE = 0.6
 
+    # Accepted sentence length range, after stripping whitespace
+    MIN_SENTENCE_LENGTH = 10
+    MAX_SENTENCE_LENGTH = 500
+
+    def __init__(self, cache: ExtractionCache | None = None):
+        """Initialize the extractor.
+
+        Args:
+            cache: Extraction cache (creates default if None)
+        """
+        self.cache = cache if cache is not None else ExtractionCache()
+        # Fused patterns keyed by the set of patterns left out of them
+        self._combined_patterns = lru_cache(maxsize=256)(self._combine_without)
+
     def extract(self, text: str) -> list[Claim]:
         """Extract claims from text using pattern matching.
 
@@ -76,126 +236,144 @@ class PatternExtractor:
         Returns:
             List of extracted claims
         """
-        matches: list[PatternMatch] = []
-
-        for claim_type, patterns in self.PATTERNS.items():
-            for pattern in patterns:
-                for match in pattern.finditer(text):
-                    matches.append(
-                        PatternMatch(
-                            start=match.start(),
-                            end=match.end(),
-                            match_text=match.group(0),
-                            claim_type=claim_type,
-                        )
-                    )
+        cached = self.cache.get(text)
+        if cached is not None:
+            # Claim IDs must stay unique across responses, so issue new ones.
+            # Deep copies keep callers from modifying the cached claims
+            id_prefix = uuid.uuid4().hex
+            return [
+                claim.model_copy(update={"id": f"{id_prefix}-{index}"}, deep=True)
+                for index, claim in enumerate(cached)
+            ]
+
+        claims = self._extract(text)
+        self.cache.set(text, [claim.model_copy(deep=True) for claim in claims])
+        return claims
+
+    def _extract(self, text: str) -> list[Claim]:
+        """Run pattern matching over text, bypassing the cache."""
+        # Match against lowercased text so patterns need no IGNORECASE flag;
+        # offsets are shared with the original text
+        lowered = _lower(text)
+        group_types = self.GROUP_TYPES
+        group_priority = self.GROUP_PRIORITY
+        # Stable sort keeps each pattern's matches in text order
+        found = sorted(
+            self._pattern_for(lowered).finditer(lowered),
+            key=lambda match: group_priority[match.lastgroup or ""],
+        )
+        matches = [
+            PatternMatch(
+                match.start(),
+                match.end(),
+                text[match.start() : match.end()],
+                group_types[match.lastgroup or ""],
+            )
+            for match in found
+        ]
+
+        # Most texts have no claims; skip the boundary index entirely
+        if not matches:
+            return []
 
         # Extract full sentences containing matches
-        claims = self._matches_to_claims(text, matches)
+        boundaries = self._sentence_boundaries(text)
+        raw_claims = self._matches_to_claims(text, matches, boundaries)
 
         # Deduplicate overlapping claims
-        claims = self._deduplicate_claims(claims)
+        raw_claims = self._deduplicate_claims(raw_claims)
+
+        # One random ID per text; claims are numbered beneath it
+        id_prefix = uuid.uuid4().hex
+        # Fields are produced here and already valid, so skip pydantic validation
+        return [
+            Claim.model_construct(
+                id=f"{id_prefix}-{index}",
+                text=raw.text,
+                type=raw.claim_type,
+                confidence=self.BASE_CONFIDENCE,
+                source_offset=SourceOffset.model_construct(start=raw.start, end=raw.end),
+            )
+            for index, raw in enumerate(raw_claims)
+        ]
+
+    def _pattern_for(self, lowered: str) -> re.Pattern[str]:
+        """Get the fused pattern without patterns that cannot match lowercased text."""
+        skip = frozenset(
+            key
+            for key, literals in self.REQUIRED_LITERALS.items()
+            if not any(literal in lowered for literal in literals)
+        )
+        return self._combined_patterns(skip) if skip else self.COMBINED_PATTERN
 
-        return claims
+    def _combine_without(self, skip: frozenset[tuple[ClaimType, int]]) -> re.Pattern[str]:
+        """Fuse all patterns except those in skip."""
+        return _combine_patterns(self.PATTERNS, skip)
+
+    def _sentence_boundaries(self, text: str) -> "array[int]":
+        """Index sentence boundary offsets once per text for bisect lookups.
+
+        The index is bracketed by sentinels -1 and len(text) so every lookup
+        lands on a valid entry.
+        """
+        return array(
+            "i",
+            [-1, *(match.start() for match in _SENTENCE_BOUNDARY.finditer(text)), len(text)],
+        )
 
-    def _matches_to_claims(self, text: str, matches: list[PatternMatch]) -> list[Claim]:
+    def _matches_to_claims(
+        self, text: str, matches: list[PatternMatch], boundaries: "array[int]"
+    ) -> list[_RawClaim]:
         """Convert pattern matches to claims with full sentence context."""
-        claims: list[Claim] = []
-        seen_sentences: set[str] = set()
+        claims: list[_RawClaim] = []
+        # Sentences are keyed by their span, which is cheaper to hash than the text
+        seen_sentences: set[tuple[int, int]] = set()
+        text_len = len(text)
 
         for match in matches:
-            # Find the sentence containing this match
-            sentence_start = self._find_sentence_start(text, match.start)
-            sentence_end = self._find_sentence_end(text, match.end)
-
-            sentence = text[sentence_start:sentence_end].strip()
+            # Sentence starts after the last boundary before the match
+            sentence_start = boundaries[bisect_right(boundaries, match.start - 1) - 1] + 1
+            # and ends after the first boundary at or past the match end (inclusive)
+            sentence_end = min(boundaries[bisect_left(boundaries, match.end)] + 1, text_len)
 
             # Skip if we've already seen this sentence
-            if sentence in seen_sentences:
+            key = (sentence_start, sentence_end)
+            if key in seen_sentences:
                 continue
-            seen_sentences.add(sentence)
+            seen_sentences.add(key)
 
-            # Skip very short or very long sentences
-            if len(sentence) < 10 or len(sentence) > 500:
+            # Skip very short or very long sentences before slicing the text
+            text_start, text_end = _strip_span(text, sentence_start, sentence_end)
+            if not self.MIN_SENTENCE_LENGTH <= text_end - text_start <= self.MAX_SENTENCE_LENGTH:
                 continue
 
-            claims.append(
-                Claim(
-                    id=str(uuid.uuid4()),
-                    text=sentence,
-                    type=match.claim_type,
-                    confidence=self.BASE_CONFIDENCE,
-                    source_offset=SourceOffset(start=sentence_start, end=sentence_end),
-                )
-            )
+            sentence = text[text_start:text_end]
+            claims.append(_RawClaim(sentence, match.claim_type, sentence_start, sentence_end))
 
         return claims
 
-    def _find_sentence_start(self, text: str, pos: int) -> int:
-        """Find the start of the sentence containing position pos."""
-        # Look backwards for sentence boundary
-        sentence_endings = ".!?\n"
-        start = pos
-        while start > 0:
-            if text[start - 1] in sentence_endings:
-                break
-            start -= 1
-        return start
-
-    def _find_sentence_end(self, text: str, pos: int) -> int:
-        """Find the end of the sentence containing position pos."""
-        # Look forwards for sentence boundary
-        sentence_endings = ".!?\n"
-        end = pos
-        while end < len(text):
-            if text[end] in sentence_endings:
-                end += 1  # Include the ending punctuation
-                break
-            end += 1
-        return end
-
-    def _deduplicate_claims(self, claims: list[Claim]) -> list[Claim]:
+    def _deduplicate_claims(self, claims: list[_RawClaim]) -> list[_RawClaim]:
         """Remove duplicate claims based on text overlap."""
         if not claims:
             return claims
 
         # Sort by source offset start position
-        sorted_claims = sorted(
-            claims, key=lambda c: c.source_offset.start if c.source_offset else 0
-        )
+        sorted_claims = sorted(claims, key=lambda c: c.start)
 
-        result: list[Claim] = []
+        result: list[_RawClaim] = []
+        # Spans of kept claims that can still overlap later ones. Claims are
+        # visited in start order, so a kept span ending at or before the
+        # current start can never overlap again and is dropped from the sweep.
+        active: list[tuple[int, int]] = []
         for claim in sorted_claims:
-            # Check if this claim overlaps significantly with any existing claim
-            is_duplicate = False
-            for existing in result:
-                if self._claims_overlap(claim, existing):
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                result.append(claim)
+            start, end = claim.start, claim.end
+            active = [span for span in active if span[1] > start]
 
-        return result
-
-    def _claims_overlap(self, claim1: Claim, claim2: Claim) -> bool:
-        """Check if two claims have significant text overlap."""
-        if not claim1.source_offset or not claim2.source_offset:
-            return claim1.text == claim2.text
-
-        start1, end1 = claim1.source_offset.start, claim1.source_offset.end
-        start2, end2 = claim2.source_offset.start, claim2.source_offset.end
-
-        # Check for overlap
-        overlap_start = max(start1, start2)
-        overlap_end = min(end1, end2)
-
-        if overlap_end <= overlap_start:
-            return False
+            # Check if this claim overlaps significantly with any live claim
+            if any(_spans_overlap(start, end, *span) for span in active):
+                continue
 
-        # Significant overlap if more than 50% of either claim overlaps
-        overlap_len = overlap_end - overlap_start
-        len1 = end1 - start1
-        len2 = end2 - start2
+            result.append(claim)
+            active.append((start, end))
 
-        return overlap_len > 0.5 * min(len1, len2)
+        return result
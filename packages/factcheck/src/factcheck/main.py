@@ -13,6 +13,8 @@ from .models import (
     ExtractClaimsResponse,
     VerifyClaimRequest,
     VerifyClaimResponse,
+    VerifyClaimsRequest,
+    VerifyClaimsResponse,
 )
 from .verification import VerificationService
 
@@ -93,3 +95,28 @@ async def verify_claim(request: VerifyClaimRequest) -> VerifyClaimResponse:
     verification = await verification_service.verify(request.claim_text)
 
     return VerifyClaimResponse(claim_id=request.claim_id, verification=verification)
+
+
+@app.post("/api/verify-claims", response_model=VerifyClaimsResponse)
+async def verify_claims(request: VerifyClaimsRequest) -> VerifyClaimsResponse:
+    """Verify several claims in one request.
+
+    Claims are verified concurrently, so the request takes about as long as
+    the slowest claim rather than the sum of all of them.
+
+    Args:
+        request: The verification request containing the claims to verify
+
+    Returns:
+        Response with a verification result per claim, in request order
+    """
+    verifications = await verification_service.verify_many(
+        [claim.claim_text for claim in request.claims]
+    )
+
+    return VerifyClaimsResponse(
+        results=[
+            VerifyClaimResponse(claim_id=claim.claim_id, verification=verification)
+            for claim, verification in zip(request.claims, verifications, strict=True)
+        ]
+    )
@@ -73,18 +73,21 @@ class VerificationSource(BaseModel):
     verdict: str  # "True", "False", "Misleading"
     published_date: str | None = Field(default=None, alias="publishedDate")
 
-    model_config = {"populate_by_name": True, "by_alias": True}
+    # Frozen since cached results are shared between requests
+    model_config = {"populate_by_name": True, "by_alias": True, "frozen": True}
 
 
 class VerificationResult(BaseModel):
     """Result of verifying a claim."""
 
     status: VerificationStatus
-    sources: list[VerificationSource]
+    sources: tuple[VerificationSource, ...]
     confidence: float = Field(ge=0, le=1)
     verified_at: str = Field(alias="verifiedAt")
 
-    model_config = {"populate_by_name": True, "by_alias": True}
+    # Frozen, with sources as a tuple, since cached results are shared
+    # between requests
+    model_config = {"populate_by_name": True, "by_alias": True, "frozen": True}
 
 
 class VerifyClaimRequest(BaseModel):
@@ -104,3 +107,16 @@ class VerifyClaimResponse(BaseModel):
     verification: VerificationResult
 
     model_config = {"populate_by_name": True, "by_alias": True}
+
+
+class VerifyClaimsRequest(BaseModel):
+    """Request to verify several claims at once."""
+
+    # Bounded to keep a single request from fanning out unbounded API calls
+    claims: list[VerifyClaimRequest] = Field(min_length=1, max_length=50)
+
+
+class VerifyClaimsResponse(BaseModel):
+    """Response containing a verification result per claim."""
+
+    results: list[VerifyClaimResponse]
@@ -1,39 +1,75 @@
 """TTL cache for verification results."""
 
 import hashlib
+import logging
+import string
+import unicodedata
 from typing import TYPE_CHECKING
 
 from cachetools import TTLCache
+from pydantic import ValidationError
 
 from ..config import settings
+from ..models import VerificationResult
 
 if TYPE_CHECKING:
-    from ..models import VerificationResult
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+# Characters dropped from the end of a claim when normalizing
+_TRAILING_CHARS = ".!?" + string.whitespace
+
+
+def normalize_claim_text(claim_text: str) -> str:
+    """Normalize claim text so trivially different phrasings are the same claim.
+
+    Applies NFKC normalization and case folding, drops trailing sentence
+    punctuation and collapses whitespace, so "Paris is the capital of France."
+    and "paris is the capital of  France" normalize identically.
+    """
+    folded = unicodedata.normalize("NFKC", claim_text).casefold()
+    return " ".join(folded.rstrip(_TRAILING_CHARS).split())
+
+
+def claim_cache_key(claim_text: str) -> str:
+    """Create a fixed-size cache key from claim text."""
+    normalized = normalize_claim_text(claim_text)
+    return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
 
 
 class VerificationCache:
-    """In-memory TTL cache for verification results."""
+    """TTL cache for verification results.
+
+    Results are held in memory and, when Redis is configured, also shared
+    through Redis so that every worker process benefits from each lookup.
+    """
 
-    def __init__(self, maxsize: int = 1000, ttl: int | None = None):
+    # Prefix for Redis keys, so the cache can share a Redis instance
+    REDIS_KEY_PREFIX = "factcheck:verification:"
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        ttl: int | None = None,
+        redis: "Redis | None" = None,
+    ):
         """Initialize the cache.
 
         Args:
-            maxsize: Maximum number of items in the cache
+            maxsize: Maximum number of items in the in-memory cache
             ttl: Time-to-live in seconds (defaults to config setting)
+            redis: Async Redis client for the shared cache (created from the
+                redis_url setting if None; disabled if that is unset)
         """
-        self._cache: TTLCache = TTLCache(
-            maxsize=maxsize,
-            ttl=ttl or settings.cache_ttl_seconds,
-        )
-
-    def _make_key(self, claim_text: str) -> str:
-        """Create a cache key from claim text."""
-        # Normalize text and create hash for consistent keys
-        normalized = claim_text.strip().lower()
-        return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+        self._ttl = ttl or settings.cache_ttl_seconds
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=self._ttl)
+        if redis is None and settings.redis_url:
+            redis = _redis_from_url(settings.redis_url)
+        self._redis = redis
 
-    def get(self, claim_text: str) -> "VerificationResult | None":
-        """Get a cached verification result.
+    async def aget(self, claim_text: str) -> "VerificationResult | None":
+        """Get a cached verification result from async code.
 
         Args:
             claim_text: The claim text to look up
@@ -41,23 +77,102 @@ class VerificationCache:
         Returns:
             The cached VerificationResult or None if not found
         """
-        key = self._make_key(claim_text)
-        return self._cache.get(key)
+        return await self.aget_by_key(claim_cache_key(claim_text))
+
+    async def aget_by_key(self, key: str) -> "VerificationResult | None":
+        """Get a cached verification result by its claim_cache_key.
+
+        Lets callers that already hold the key skip normalizing the claim again.
 
-    def set(self, claim_text: str, result: "VerificationResult") -> None:
-        """Cache a verification result.
+        Checks memory first, then Redis. A Redis hit is copied into memory
+        so later lookups in this process don't leave it; the copy gets a
+        fresh in-memory TTL, so a result can be served for up to twice the
+        TTL after it was first cached. Redis errors and entries that fail
+        to parse are logged and treated as a miss; unparseable entries are
+        also deleted so the claim is verified afresh.
+
+        Args:
+            key: The claim_cache_key of the claim text
+
+        Returns:
+            The cached VerificationResult or None if not found
+        """
+        result = self._cache.get(key)
+        if result is not None or self._redis is None:
+            return result
+
+        try:
+            data = await self._redis.get(self.REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", e)
+            return None
+        if data is None:
+            return None
+
+        try:
+            result = VerificationResult.model_validate_json(data)
+        except ValidationError as e:
+            logger.warning("Discarding invalid Redis cache entry: %s", e)
+            try:
+                await self._redis.delete(self.REDIS_KEY_PREFIX + key)
+            except Exception as e:
+                logger.warning("Redis cache delete failed: %s", e)
+            return None
+
+        self._cache[key] = result
+        return result
+
+    async def aset(self, claim_text: str, result: "VerificationResult") -> None:
+        """Cache a verification result from async code.
 
         Args:
             claim_text: The claim text as key
             result: The verification result to cache
         """
-        key = self._make_key(claim_text)
+        await self.aset_by_key(claim_cache_key(claim_text), result)
+
+    async def aset_by_key(self, key: str, result: "VerificationResult") -> None:
+        """Cache a verification result by its claim_cache_key.
+
+        Writes to memory and, if configured, Redis. Redis errors are logged
+        and otherwise ignored.
+
+        Args:
+            key: The claim_cache_key of the claim text
+            result: The verification result to cache
+        """
         self._cache[key] = result
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.set(
+                self.REDIS_KEY_PREFIX + key, result.model_dump_json(), ex=self._ttl
+            )
+        except Exception as e:
+            logger.warning("Redis cache write failed: %s", e)
 
     def clear(self) -> None:
-        """Clear all cached entries."""
+        """Clear all in-memory cached entries."""
         self._cache.clear()
 
+    async def close(self) -> None:
+        """Close the Redis connection, if any."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
     def __len__(self) -> int:
         """Return the number of cached entries."""
         return len(self._cache)
+
+
+def _redis_from_url(url: str) -> "Redis":
+    """Create an async Redis client, requiring the optional redis extra."""
+    try:
+        from redis.asyncio import Redis
+    except ImportError as e:
+        raise ImportError(
+            "redis_url is set but redis is not installed; install groundcheck-factcheck[redis]"
+        ) from e
+    return Redis.from_url(url)
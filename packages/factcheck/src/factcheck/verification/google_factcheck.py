@@ -25,16 +25,56 @@ class GoogleFactCheckClient:
     """Client for Google Fact Check Tools API."""
 
     BASE_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
-    MAX_RETRIES = 3
+    MAX_ATTEMPTS = 3
     INITIAL_BACKOFF = 1.0
+    # Timeout in seconds for each request attempt
+    DEFAULT_TIMEOUT = 10.0
+    # Connection pool shared by all searches; HTTP/2 multiplexes concurrent
+    # requests over a single connection, kept open between bursts of searches
+    CONNECTION_LIMITS = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+    )
+    # Maximum number of searches in flight at once across all callers. The
+    # API has no batch endpoint, so this caps upstream concurrency; it does
+    # not limit the request rate (429s are still handled by backoff)
+    MAX_CONCURRENT_REQUESTS = 20
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_attempts: int = MAX_ATTEMPTS,
+    ):
+        """Initialize the client.
 
-    def __init__(self, api_key: str | None = None):
+        Args:
+            api_key: Google API key (defaults to config setting)
+            timeout: Timeout in seconds for each request attempt
+            max_attempts: Requests made per search, including the first,
+                before the last error is raised
+
+        Raises:
+            ValueError: If timeout is not positive or max_attempts is below 1
+        """
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
         self.api_key = api_key or settings.google_api_key
+        self.timeout = timeout
+        self.max_attempts = max_attempts
         self._client: httpx.AsyncClient | None = None
+        # Query parameters shared by every search
+        self._base_params = {"key": self.api_key, "languageCode": "en"}
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=10.0)
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                limits=self.CONNECTION_LIMITS,
+            )
         return self._client
 
     async def close(self) -> None:
@@ -59,23 +99,20 @@ class GoogleFactCheckClient:
             return []
 
         client = await self._get_client()
-        params = {
-            "key": self.api_key,
-            "query": query,
-            "languageCode": "en",
-        }
+        params = {**self._base_params, "query": query}
 
         backoff = self.INITIAL_BACKOFF
         last_error: Exception | None = None
 
-        for attempt in range(self.MAX_RETRIES):
+        for attempt in range(self.max_attempts):
             try:
-                response = await client.get(self.BASE_URL, params=params)
+                async with self._request_slots:
+                    response = await client.get(self.BASE_URL, params=params)
 
                 if response.status_code == 429:
                     # Rate limited, apply exponential backoff
                     logger.warning(
-                        f"Rate limited, retrying in {backoff}s (attempt {attempt + 1})"
+                        "Rate limited, retrying in %ss (attempt %d)", backoff, attempt + 1
                     )
                     # Track rate limit as an error so we don't silently return empty
                     last_error = httpx.HTTPStatusError(
@@ -93,7 +130,7 @@ class GoogleFactCheckClient:
                 try:
                     data = response.json()
                 except ValueError as e:
-                    logger.error(f"Failed to parse JSON response: {e}")
+                    logger.error("Failed to parse JSON response: %s", e)
                     raise httpx.DecodingError(str(e)) from e
 
                 return self._parse_response(data)
@@ -103,20 +140,22 @@ class GoogleFactCheckClient:
                 if e.response.status_code >= 500:
                     # Server error, retry with backoff
                     logger.warning(
-                        f"Server error {e.response.status_code}, "
-                        f"retrying in {backoff}s (attempt {attempt + 1})"
+                        "Server error %s, retrying in %ss (attempt %d)",
+                        e.response.status_code,
+                        backoff,
+                        attempt + 1,
                     )
                     await asyncio.sleep(backoff)
                     backoff *= 2
                     continue
                 # Client error (4xx except 429), don't retry
-                logger.error(f"API client error: {e.response.status_code}")
+                logger.error("API client error: %s", e.response.status_code)
                 raise
 
             except (httpx.RequestError, httpx.DecodingError) as e:
                 last_error = e
                 logger.warning(
-                    f"Request error, retrying in {backoff}s (attempt {attempt + 1}): {e}"
+                    "Request error, retrying in %ss (attempt %d): %s", backoff, attempt + 1, e
                 )
                 await asyncio.sleep(backoff)
                 backoff *= 2
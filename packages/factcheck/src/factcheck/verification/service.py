@@ -1,15 +1,39 @@
 """Verification service for fact-checking claims."""
 
+import asyncio
 import logging
 import re
+import time
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 
 from ..models import VerificationResult, VerificationSource, VerificationStatus
-from .cache import VerificationCache
+from .cache import VerificationCache, claim_cache_key
 from .google_factcheck import GoogleFactCheckClient
 
 logger = logging.getLogger(__name__)
 
+# Most recent second formatted by _now_iso and its ISO 8601 string, kept as
+# one tuple so the pair is always replaced together
+_last_ts: tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string, to the second.
+
+    The string is formatted once per second and reused, since many results
+    are stamped within the same second under load.
+    """
+    global _last_ts
+    now = int(time.time())
+    last_sec, last_str = _last_ts
+    if now == last_sec:
+        return last_str
+    now_str = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _last_ts = (now, now_str)
+    return now_str
+
 
 class VerificationService:
     """Service for verifying claims using external fact-check APIs."""
@@ -25,6 +49,16 @@ class VerificationService:
         r"\bpants on fire\b", r"\bdisputed\b", r"\bmisleading\b"
         # Note: "unverified" is NOT included here - it should be treated as neutral/unclassified
     ]
+    # Both lists precompiled as one alternation with a named group per list, so
+    # a verdict is scanned once and each match is labelled by the list it hit.
+    # Matched case-insensitively so verdicts needn't be lowercased first
+    _VERDICT_RE = re.compile(
+        f"(?P<true>{'|'.join(TRUE_PATTERNS)})|(?P<false>{'|'.join(FALSE_PATTERNS)})",
+        re.IGNORECASE,
+    )
+
+    # Maximum number of claims verified concurrently by verify_many
+    MAX_CONCURRENT_VERIFICATIONS = 10
 
     def __init__(
         self,
@@ -34,11 +68,20 @@ class VerificationService:
         """Initialize the verification service.
 
         Args:
-            google_client: Google Fact Check API client (creates default if None)
+            google_client: Google Fact Check API client (creates default if None).
+                The client keeps a pooled HTTP/2 connection open between
+                searches, so one instance should be shared rather than
+                created per request
             cache: Verification cache (creates default if None)
         """
         self.google_client = google_client or GoogleFactCheckClient()
-        self.cache = cache or VerificationCache()
+        self.cache = cache if cache is not None else VerificationCache()
+        # Lookups in progress, keyed like the cache, so concurrent
+        # requests for the same claim share a single API call
+        self._inflight: dict[str, asyncio.Future[VerificationResult]] = {}
+        # Fact-checkers draw verdicts from a small vocabulary ("False",
+        # "Mostly True", ...), so most classifications are cache hits
+        self._classify_verdict = lru_cache(maxsize=1024)(self._match_verdict)
 
     async def verify(self, claim_text: str) -> VerificationResult:
         """Verify a claim using external fact-check sources.
@@ -49,17 +92,32 @@ class VerificationService:
         Returns:
             VerificationResult with status, sources, and confidence
         """
+        # Normalize once; the key is shared by the cache and in-flight lookups
+        key = claim_cache_key(claim_text)
+
         # Check cache first
-        cached = self.cache.get(claim_text)
+        cached = await self.cache.aget_by_key(key)
         if cached is not None:
-            logger.debug(f"Cache hit for claim: {claim_text[:50]}...")
+            logger.debug("Cache hit for claim: %.50s...", claim_text)
             return cached
 
+        # Join an in-progress lookup for the same claim rather than starting another
+        lookup = self._inflight.get(key)
+        if lookup is None:
+            lookup = asyncio.ensure_future(self._verify_uncached(claim_text, key))
+            self._inflight[key] = lookup
+            lookup.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(lookup)
+
+    async def _verify_uncached(self, claim_text: str, key: str) -> VerificationResult:
+        """Verify a claim against the fact-check API and cache it under key."""
         # Query Google Fact Check API
         try:
             fact_checks = await self.google_client.search(claim_text)
         except Exception as e:
-            logger.error(f"Failed to query fact-check API: {e}")
+            logger.error("Failed to query fact-check API: %s", e)
             return self._create_error_result()
 
         # Convert to VerificationSource objects
@@ -78,16 +136,48 @@ class VerificationService:
 
         result = VerificationResult(
             status=status,
-            sources=sources,
+            sources=tuple(sources),
             confidence=confidence,
-            verified_at=datetime.now(timezone.utc).isoformat(),
+            verified_at=_now_iso(),
         )
 
         # Cache the result
-        self.cache.set(claim_text, result)
+        await self.cache.aset_by_key(key, result)
 
         return result
 
+    async def verify_many(self, claim_texts: list[str]) -> list[VerificationResult]:
+        """Verify several claims concurrently.
+
+        A failure verifying one claim yields an error result for that claim
+        only, so the rest of the batch is still returned.
+
+        Args:
+            claim_texts: The claim texts to verify
+
+        Returns:
+            VerificationResults in the same order as claim_texts
+        """
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_VERIFICATIONS)
+
+        async def verify_one(claim_text: str) -> VerificationResult:
+            async with semaphore:
+                return await self.verify(claim_text)
+
+        results = await asyncio.gather(
+            *(verify_one(claim_text) for claim_text in claim_texts),
+            return_exceptions=True,
+        )
+
+        verifications: list[VerificationResult] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Failed to verify claim: %s", result)
+                verifications.append(self._create_error_result())
+            else:
+                verifications.append(result)
+        return verifications
+
     def _aggregate_results(
         self, sources: list[VerificationSource]
     ) -> tuple[VerificationStatus, float]:
@@ -102,16 +192,11 @@ class VerificationService:
         if not sources:
             return VerificationStatus.UNVERIFIED, 0.0
 
-        true_count = 0
-        false_count = 0
-
-        for source in sources:
-            rating_lower = source.verdict.lower()
-            # Use regex with word boundaries to avoid false matches (e.g., "unverified" != "verified")
-            if any(re.search(pattern, rating_lower) for pattern in self.TRUE_PATTERNS):
-                true_count += 1
-            elif any(re.search(pattern, rating_lower) for pattern in self.FALSE_PATTERNS):
-                false_count += 1
+        # Every source is tallied even once the winner is decided, because
+        # confidence is the winning count over all sources
+        counts = Counter(self._classify_verdict(source.verdict) for source in sources)
+        true_count = counts[VerificationStatus.VERIFIED]
+        false_count = counts[VerificationStatus.DISPUTED]
 
         total_classified = true_count + false_count
 
@@ -130,15 +215,34 @@ class VerificationService:
             # Equal true/false counts
             return VerificationStatus.UNVERIFIED, 0.5
 
+    def _match_verdict(self, verdict: str) -> VerificationStatus | None:
+        """Classify a single fact-checker verdict.
+
+        Args:
+            verdict: The textual rating, e.g. "Mostly False"
+
+        Returns:
+            VERIFIED or DISPUTED, or None if the verdict matches neither list
+        """
+        # Use regex with word boundaries to avoid false matches (e.g., "unverified" != "verified")
+        labels = {match.lastgroup for match in self._VERDICT_RE.finditer(verdict)}
+        # A true pattern anywhere in the verdict takes precedence
+        if "true" in labels:
+            return VerificationStatus.VERIFIED
+        if "false" in labels:
+            return VerificationStatus.DISPUTED
+        return None
+
     def _create_error_result(self) -> VerificationResult:
         """Create an error verification result."""
         return VerificationResult(
             status=VerificationStatus.ERROR,
-            sources=[],
+            sources=(),
             confidence=0.0,
-            verified_at=datetime.now(timezone.utc).isoformat(),
+            verified_at=_now_iso(),
         )
 
     async def close(self) -> None:
         """Clean up resources."""
         await self.google_client.close()
+        await self.cache.close()
@@ -0,0 +1,14 @@
+"""Shared test fixtures."""
+
+import httpx
+import pytest_asyncio
+
+from factcheck.main import app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
+    """Create an async test client shared by the whole session."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
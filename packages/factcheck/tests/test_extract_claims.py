@@ -1,24 +1,27 @@
 """Tests for the claim extraction API."""
 
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
 import pytest
-from fastapi.testclient import TestClient
 
-from factcheck.main import app
+from factcheck.extractors import ExtractionCache, PatternExtractor
+from factcheck.extractors.patterns import _check_required_literals
 from factcheck.models import ClaimType
 
 
-@pytest.fixture
-def client():
-    """Create a test client."""
-    return TestClient(app)
+@pytest.fixture(scope="module")
+def extractor():
+    """Create a pattern extractor shared by the module's tests."""
+    return PatternExtractor()
 
 
 class TestExtractClaimsEndpoint:
     """Tests for the /api/extract-claims endpoint."""
 
-    def test_extract_claims_statistical(self, client):
+    async def test_extract_claims_statistical(self, client):
         """Test extraction of statistical claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "In 2024, 75% of users preferred AI assistants over traditional search.",
@@ -37,9 +40,9 @@ class TestExtractClaimsEndpoint:
         claim_types = [c["type"] for c in data["claims"]]
         assert ClaimType.STATISTICAL.value in claim_types or ClaimType.TEMPORAL.value in claim_types
 
-    def test_extract_claims_temporal(self, client):
+    async def test_extract_claims_temporal(self, client):
         """Test extraction of temporal claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "The company was founded in 1999 and has grown significantly since then.",
@@ -54,9 +57,9 @@ class TestExtractClaimsEndpoint:
         claim_types = [c["type"] for c in data["claims"]]
         assert ClaimType.TEMPORAL.value in claim_types
 
-    def test_extract_claims_factual(self, client):
+    async def test_extract_claims_factual(self, client):
         """Test extraction of factual claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "Paris is the capital of France and is located in Western Europe.",
@@ -71,9 +74,9 @@ class TestExtractClaimsEndpoint:
         claim_types = [c["type"] for c in data["claims"]]
         assert ClaimType.FACTUAL.value in claim_types
 
-    def test_extract_claims_attribution(self, client):
+    async def test_extract_claims_attribution(self, client):
         """Test extraction of attribution claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "According to recent studies, exercise improves mental health.",
@@ -88,9 +91,9 @@ class TestExtractClaimsEndpoint:
         claim_types = [c["type"] for c in data["claims"]]
         assert ClaimType.ATTRIBUTION.value in claim_types
 
-    def test_extract_claims_comparative(self, client):
+    async def test_extract_claims_comparative(self, client):
         """Test extraction of comparative claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "Python is faster than Ruby for most data processing tasks.",
@@ -105,9 +108,9 @@ class TestExtractClaimsEndpoint:
         claim_types = [c["type"] for c in data["claims"]]
         assert ClaimType.COMPARATIVE.value in claim_types
 
-    def test_extract_claims_no_claims(self, client):
+    async def test_extract_claims_no_claims(self, client):
         """Test with text that has no extractable claims."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "Hello, how are you today?",
@@ -120,9 +123,9 @@ class TestExtractClaimsEndpoint:
 
         assert data["claims"] == []
 
-    def test_extract_claims_multiple_claims(self, client):
+    async def test_extract_claims_multiple_claims(self, client):
         """Test extraction of multiple claims from a paragraph."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": """Apple was founded in 1976 and is the largest technology company
@@ -138,9 +141,9 @@ class TestExtractClaimsEndpoint:
         # Should find multiple different claim types
         assert len(data["claims"]) >= 2
 
-    def test_extract_claims_invalid_source(self, client):
+    async def test_extract_claims_invalid_source(self, client):
         """Test with invalid source."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "Some text here.",
@@ -150,9 +153,9 @@ class TestExtractClaimsEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    def test_extract_claims_empty_text(self, client):
+    async def test_extract_claims_empty_text(self, client):
         """Test with empty text."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "",
@@ -162,9 +165,9 @@ class TestExtractClaimsEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    def test_extract_claims_with_response_id(self, client):
+    async def test_extract_claims_with_response_id(self, client):
         """Test with optional response ID."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "The company was founded in 2020.",
@@ -175,9 +178,9 @@ class TestExtractClaimsEndpoint:
 
         assert response.status_code == 200
 
-    def test_extract_claims_claude_source(self, client):
+    async def test_extract_claims_claude_source(self, client):
         """Test with Claude as source."""
-        response = client.post(
+        response = await client.post(
             "/api/extract-claims",
             json={
                 "text": "In 2023, global temperatures reached record highs.",
@@ -194,41 +197,29 @@ class TestExtractClaimsEndpoint:
 class TestPatternExtractor:
     """Tests for the pattern extractor directly."""
 
-    def test_percentage_pattern(self):
+    def test_percentage_pattern(self, extractor):
         """Test percentage detection."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         claims = extractor.extract("Studies show 85% of participants improved.")
 
         assert len(claims) >= 1
         assert any(c.type == ClaimType.STATISTICAL for c in claims)
 
-    def test_year_pattern(self):
+    def test_year_pattern(self, extractor):
         """Test year detection."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         claims = extractor.extract("The technology was invented in 1989.")
 
         assert len(claims) >= 1
         assert any(c.type == ClaimType.TEMPORAL for c in claims)
 
-    def test_superlative_pattern(self):
+    def test_superlative_pattern(self, extractor):
         """Test superlative detection."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         claims = extractor.extract("It is the largest building in the world.")
 
         assert len(claims) >= 1
         assert any(c.type == ClaimType.FACTUAL for c in claims)
 
-    def test_sentence_extraction(self):
+    def test_sentence_extraction(self, extractor):
         """Test that full sentences are extracted."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         text = "First sentence. The company was founded in 2010. Last sentence."
         claims = extractor.extract(text)
 
@@ -236,11 +227,8 @@ class TestPatternExtractor:
         if claims:
             assert "founded in 2010" in claims[0].text
 
-    def test_deduplication(self):
+    def test_deduplication(self, extractor):
         """Test that overlapping claims are deduplicated."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         # This sentence could match multiple patterns
         text = "In 2020, 50% of the population was affected by the change."
         claims = extractor.extract(text)
@@ -249,21 +237,15 @@ class TestPatternExtractor:
         texts = [c.text for c in claims]
         assert len(texts) == len(set(texts))
 
-    def test_confidence_range(self):
+    def test_confidence_range(self, extractor):
         """Test that confidence is in valid range."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         claims = extractor.extract("The company has over 1 million users since 2019.")
 
         for claim in claims:
             assert 0 <= claim.confidence <= 1
 
-    def test_source_offset(self):
+    def test_source_offset(self, extractor):
         """Test that source offsets are correct."""
-        from factcheck.extractors import PatternExtractor
-
-        extractor = PatternExtractor()
         text = "The company was founded in 1999."
         claims = extractor.extract(text)
 
@@ -272,3 +254,103 @@ class TestPatternExtractor:
             assert offset is not None
             extracted = text[offset.start : offset.end]
             assert "founded" in extracted or "1999" in extracted
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "In 2023, the company had over 2.5 million users.",
+            "Tesla was founded in 2003 and has 1.8 million customers.",
+            "According to Gartner, revenue grew 4.5% of total in 2022.",
+        ],
+    )
+    def test_decimal_numbers_keep_whole_sentence(self, extractor, text):
+        """Test that earlier-declared patterns win, so decimals don't split sentences."""
+        claims = extractor.extract(text)
+
+        assert [(c.text, c.type) for c in claims] == [(text, ClaimType.STATISTICAL)]
+
+    def test_claim_ids_unique(self, extractor):
+        """Test that claim IDs are unique within and across extractions."""
+        text = "The company was founded in 1999. It is the largest in the region."
+        ids = [c.id for c in extractor.extract(text)] + [c.id for c in extractor.extract(text)]
+
+        assert len(ids) == 4
+        assert len(ids) == len(set(ids))
+
+    def test_repeated_sentence_offsets(self, extractor):
+        """Test that a sentence repeated later in the text is kept at each offset."""
+        text = "It was founded in 1999. Hello there. It was founded in 1999."
+        claims = extractor.extract(text)
+
+        offsets = [(c.source_offset.start, c.source_offset.end) for c in claims]
+        assert offsets == [(0, 23), (36, 60)]
+
+    def test_patterns_without_required_literals_are_skipped(self, extractor):
+        """Test that patterns whose anchor words are absent are left out of the scan."""
+        pattern = extractor._pattern_for("The company was founded in 1999.")
+
+        assert "TEMPORAL_1" in pattern.groupindex
+        assert "ATTRIBUTION_0" not in pattern.groupindex
+        assert "COMPARATIVE_0" not in pattern.groupindex
+
+    def test_required_literals_must_match_their_pattern(self):
+        """Test that a literal table out of step with PATTERNS is rejected."""
+        reordered = {
+            ClaimType.ATTRIBUTION: list(reversed(PatternExtractor.PATTERNS[ClaimType.ATTRIBUTION]))
+        }
+
+        with pytest.raises(ValueError, match="ATTRIBUTION_0"):
+            _check_required_literals(reordered, {(ClaimType.ATTRIBUTION, 0): ("according",)})
+        with pytest.raises(ValueError, match="ATTRIBUTION_3"):
+            _check_required_literals(reordered, {(ClaimType.ATTRIBUTION, 3): ("according",)})
+
+    def test_uppercase_text(self, extractor):
+        """Test that matching is case-insensitive."""
+        claims = extractor.extract("ACCORDING TO FORBES, SALES ROSE LAST YEAR.")
+
+        assert [c.type for c in claims] == [ClaimType.ATTRIBUTION]
+
+    def test_cached_extraction(self):
+        """Test that repeated texts are served from the cache with fresh IDs."""
+        cache = ExtractionCache()
+        extractor = PatternExtractor(cache=cache)
+        text = "The company was founded in 1999."
+        first = extractor.extract(text)
+
+        with patch.object(extractor, "_extract") as extract_uncached:
+            second = extractor.extract(text)
+
+        extract_uncached.assert_not_called()
+        assert len(cache) == 1
+        assert [c.text for c in second] == [c.text for c in first]
+        assert [c.source_offset for c in second] == [c.source_offset for c in first]
+        assert {c.id for c in second}.isdisjoint(c.id for c in first)
+
+    def test_cached_claims_not_shared_with_callers(self):
+        """Test that modifying returned claims leaves the cached claims intact."""
+        extractor = PatternExtractor(cache=ExtractionCache())
+        text = "The company was founded in 1999."
+
+        for claims in (extractor.extract(text), extractor.extract(text)):
+            claims[0].text = "changed"
+            claims[0].source_offset.start = 99
+            claims.clear()
+
+        claim = extractor.extract(text)[0]
+        assert claim.text == text
+        assert claim.source_offset.start == 0
+
+    def test_cache_concurrent_access(self):
+        """Test that the cache can be shared by threadpool workers."""
+        cache = ExtractionCache(maxsize=8, ttl=1)
+
+        def churn(worker: int) -> None:
+            for i in range(2000):
+                text = f"text {worker} {i % 16}"
+                cache.set(text, [])
+                cache.get(text)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))
+
+        assert len(cache) <= 8
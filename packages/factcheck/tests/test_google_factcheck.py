@@ -0,0 +1,92 @@
+"""Tests for the Google Fact Check Tools API client."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from factcheck.verification import GoogleFactCheckClient
+
+
+class TestGoogleFactCheckClient:
+    """Tests for client configuration and retries."""
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"timeout": 0}, {"timeout": -1.0}, {"max_attempts": 0}, {"max_attempts": -1}]
+    )
+    def test_invalid_settings_rejected(self, kwargs):
+        """Test that settings which would disable requests are rejected."""
+        with pytest.raises(ValueError):
+            GoogleFactCheckClient(api_key="key", **kwargs)
+
+    async def test_timeout_reaches_http_client(self):
+        """Test that the configured timeout is used by the HTTP client."""
+        client = GoogleFactCheckClient(api_key="key", timeout=2.5)
+
+        http_client = await client._get_client()
+
+        assert http_client.timeout == httpx.Timeout(2.5)
+        await client.close()
+
+    async def test_search_makes_max_attempts_requests(self):
+        """Test that a failing search is attempted max_attempts times, then raises."""
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(503)
+
+        client = GoogleFactCheckClient(api_key="key", max_attempts=2)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch("asyncio.sleep", AsyncMock()), pytest.raises(httpx.HTTPStatusError):
+            await client.search("The sky is green")
+
+        assert attempts == 2
+        await client.close()
+
+    async def test_single_attempt_returns_results(self):
+        """Test that max_attempts=1 still performs the search."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            review = {"publisher": {"name": "Snopes"}, "url": "https://x", "textualRating": "False"}
+            return httpx.Response(200, json={"claims": [{"claimReview": [review]}]})
+
+        client = GoogleFactCheckClient(api_key="key", max_attempts=1)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = await client.search("The sky is green")
+
+        assert [r.rating for r in results] == ["False"]
+        await client.close()
+
+    async def test_concurrent_searches_capped(self):
+        """Test that no more than MAX_CONCURRENT_REQUESTS searches are in flight."""
+        cap = GoogleFactCheckClient.MAX_CONCURRENT_REQUESTS
+        in_flight = 0
+        peak = 0
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return httpx.Response(200, json={})
+
+        client = GoogleFactCheckClient(api_key="key")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        searches = [asyncio.create_task(client.search(f"claim {i}")) for i in range(cap + 5)]
+        for _ in range(100):
+            await asyncio.sleep(0)
+        assert in_flight == cap
+
+        release.set()
+        await asyncio.gather(*searches)
+
+        assert peak == cap
+        await client.close()
@@ -0,0 +1,291 @@
+"""Tests for the verification service."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from factcheck.models import VerificationResult, VerificationSource, VerificationStatus
+from factcheck.verification import VerificationCache, VerificationService
+from factcheck.verification.cache import claim_cache_key, normalize_claim_text
+from factcheck.verification.google_factcheck import FactCheckResult
+from factcheck.verification.service import _now_iso
+
+
+def _sources(*verdicts: str) -> list[VerificationSource]:
+    return [VerificationSource(name="Snopes", url="https://x", verdict=v) for v in verdicts]
+
+
+class TestAggregateResults:
+    """Tests for aggregating fact-check verdicts."""
+
+    @pytest.mark.parametrize(
+        ("verdict", "status"),
+        [
+            ("True", VerificationStatus.VERIFIED),
+            ("Mostly True", VerificationStatus.VERIFIED),
+            ("Verified", VerificationStatus.VERIFIED),
+            ("Correct", VerificationStatus.VERIFIED),
+            ("False", VerificationStatus.DISPUTED),
+            ("Pants on Fire!", VerificationStatus.DISPUTED),
+            ("Misleading", VerificationStatus.DISPUTED),
+            ("Incorrect", VerificationStatus.DISPUTED),
+            ("Inaccurate", VerificationStatus.DISPUTED),
+            ("Unverified", VerificationStatus.UNVERIFIED),
+            ("Not verified", VerificationStatus.UNVERIFIED),
+            ("Un-verified", VerificationStatus.UNVERIFIED),
+            ("NOT VERIFIED", VerificationStatus.UNVERIFIED),
+            ("MOSTLY FALSE", VerificationStatus.DISPUTED),
+            ("Satire", VerificationStatus.UNVERIFIED),
+        ],
+    )
+    def test_single_verdict(self, verdict, status):
+        """Test classification of individual verdicts."""
+        result_status, _ = VerificationService()._aggregate_results(_sources(verdict))
+
+        assert result_status == status
+
+    def test_true_takes_precedence_within_a_verdict(self):
+        """Test that a verdict matching both lists counts as true."""
+        verdict = "Misleading, not entirely true"
+        status, _ = VerificationService()._aggregate_results(_sources(verdict))
+
+        assert status == VerificationStatus.VERIFIED
+
+    def test_confidence_counts_all_sources(self):
+        """Test that confidence reflects agreement across every source."""
+        status, confidence = VerificationService()._aggregate_results(
+            _sources("False", "False", "False", "True")
+        )
+
+        assert status == VerificationStatus.DISPUTED
+        assert confidence == 0.75
+
+    def test_tie_is_unverified(self):
+        """Test that equal true/false counts are unverified."""
+        assert VerificationService()._aggregate_results(_sources("True", "False")) == (
+            VerificationStatus.UNVERIFIED,
+            0.5,
+        )
+
+    def test_no_sources(self):
+        """Test that no sources is unverified with zero confidence."""
+        assert VerificationService()._aggregate_results([]) == (VerificationStatus.UNVERIFIED, 0.0)
+
+    def test_repeated_verdicts_classified_once(self):
+        """Test that repeated verdict strings reuse their classification."""
+        service = VerificationService()
+
+        service._aggregate_results(_sources("False", "False", "Mostly True", "False"))
+
+        assert service._classify_verdict.cache_info().misses == 2
+
+
+class TestVerify:
+    """Tests for verifying a single claim."""
+
+    async def test_cached_result_skips_api(self):
+        """Test that a cached result is returned without querying the API."""
+        google_client = AsyncMock()
+        google_client.search.return_value = []
+        service = VerificationService(google_client=google_client, cache=VerificationCache())
+
+        first = await service.verify("The earth orbits the sun.")
+        second = await service.verify("The earth orbits the sun.")
+
+        assert second is first
+        google_client.search.assert_awaited_once()
+
+    async def test_concurrent_requests_share_lookup(self):
+        """Test that concurrent requests for the same claim make one API call."""
+
+        async def search(query: str) -> list[object]:
+            await asyncio.sleep(0.01)
+            return []
+
+        google_client = AsyncMock()
+        google_client.search.side_effect = search
+        service = VerificationService(google_client=google_client, cache=VerificationCache())
+
+        results = await asyncio.gather(
+            service.verify("Water boils at 100C."),
+            service.verify("water boils  at 100C."),
+            service.verify("Water boils at 100C."),
+        )
+
+        assert results[0] is results[1] is results[2]
+        google_client.search.assert_awaited_once()
+        assert service._inflight == {}
+
+    async def test_cache_ignores_case_whitespace_and_trailing_punctuation(self):
+        """Test that trivially different phrasings of a claim share a cache entry."""
+        google_client = AsyncMock()
+        google_client.search.return_value = []
+        service = VerificationService(google_client=google_client, cache=VerificationCache())
+
+        first = await service.verify("Paris is the capital of France.")
+        second = await service.verify("  paris is the capital of  France")
+
+        assert second is first
+        google_client.search.assert_awaited_once()
+
+    async def test_claim_normalized_once_per_miss(self):
+        """Test that a cache miss normalizes the claim text only once."""
+        google_client = AsyncMock()
+        google_client.search.return_value = []
+        service = VerificationService(google_client=google_client, cache=VerificationCache())
+
+        with patch(
+            "factcheck.verification.cache.normalize_claim_text", wraps=normalize_claim_text
+        ) as normalize:
+            await service.verify("The sky is green")
+
+        normalize.assert_called_once_with("The sky is green")
+
+    async def test_cached_result_is_immutable(self):
+        """Test that a result shared through the cache can't be modified."""
+        google_client = AsyncMock()
+        google_client.search.return_value = [
+            FactCheckResult(publisher_name="Snopes", url="https://x", rating="False")
+        ]
+        service = VerificationService(google_client=google_client, cache=VerificationCache())
+
+        result = await service.verify("The sky is green")
+
+        with pytest.raises(ValidationError):
+            result.status = VerificationStatus.VERIFIED
+        with pytest.raises(AttributeError):
+            result.sources.append(_sources("True")[0])
+        with pytest.raises(ValidationError):
+            result.sources[0].verdict = "True"
+
+
+class TestVerifyMany:
+    """Tests for verifying a batch of claims."""
+
+    async def test_unexpected_errors_become_error_results(self):
+        """Test that a claim whose verification raises doesn't fail the batch."""
+        service = VerificationService(google_client=AsyncMock(), cache=VerificationCache())
+        ok = service._create_error_result().model_copy(
+            update={"status": VerificationStatus.UNVERIFIED}
+        )
+
+        async def verify(claim_text: str) -> VerificationResult:
+            if claim_text == "bad":
+                raise RuntimeError("boom")
+            return ok
+
+        with patch.object(service, "verify", side_effect=verify):
+            results = await service.verify_many(["good", "bad", "good"])
+
+        assert [r.status for r in results] == [
+            VerificationStatus.UNVERIFIED,
+            VerificationStatus.ERROR,
+            VerificationStatus.UNVERIFIED,
+        ]
+
+
+class TestClaimCacheKey:
+    """Tests for claim cache key normalization."""
+
+    @pytest.mark.parametrize(
+        ("first", "second"),
+        [
+            ("Paris is the capital of France.", "  paris is the capital of  France"),
+            ("Ｐａｒｉｓ has 2 million people", "Paris has 2 million people"),
+            ("Die Straße ist lang", "DIE STRASSE IST LANG"),
+        ],
+    )
+    def test_equivalent_claims_share_a_key(self, first, second):
+        """Test that claims differing only in form map to the same key."""
+        assert claim_cache_key(first) == claim_cache_key(second)
+
+    def test_different_claims_have_different_keys(self):
+        """Test that distinct claims don't collide."""
+        assert claim_cache_key("Paris is in France") != claim_cache_key("Paris is in Texas")
+
+
+class _FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def aclose(self):
+        pass
+
+
+class TestVerificationCache:
+    """Tests for the shared Redis tier of the verification cache."""
+
+    async def test_result_shared_through_redis(self):
+        """Test that a result cached by one worker is found by another."""
+        redis = _FakeRedis()
+        result = VerificationResult(
+            status=VerificationStatus.DISPUTED,
+            sources=_sources("False"),
+            confidence=1.0,
+            verified_at="2024-01-01T00:00:00+00:00",
+        )
+
+        await VerificationCache(redis=redis).aset("The sky is green", result)
+        other_worker = VerificationCache(redis=redis)
+
+        assert await other_worker.aget("the sky is green") == result
+        assert len(other_worker) == 1
+
+    async def test_redis_errors_are_misses(self):
+        """Test that a failing Redis degrades to the in-memory cache."""
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError("down")
+        redis.set.side_effect = ConnectionError("down")
+        cache = VerificationCache(redis=redis)
+
+        assert await cache.aget("The sky is green") is None
+        result = VerificationService()._create_error_result()
+        await cache.aset("The sky is green", result)
+        assert await cache.aget("The sky is green") is result
+
+    async def test_invalid_redis_entries_are_misses(self):
+        """Test that an unparseable Redis entry is discarded and re-verified."""
+        redis = _FakeRedis()
+        cache = VerificationCache(redis=redis)
+        key = VerificationCache.REDIS_KEY_PREFIX + claim_cache_key("The sky is green")
+        redis.data[key] = '{"status":"verified"}'
+
+        assert await cache.aget("The sky is green") is None
+        assert key not in redis.data
+
+        redis.data[key] = '{"status":"verified"}'
+        google_client = AsyncMock()
+        google_client.search.return_value = []
+        service = VerificationService(google_client=google_client, cache=cache)
+
+        result = await service.verify("The sky is green")
+
+        assert result.status == VerificationStatus.UNVERIFIED
+        google_client.search.assert_awaited_once()
+        assert VerificationResult.model_validate_json(redis.data[key]) == result
+
+
+class TestNowIso:
+    """Tests for the cached verification timestamp."""
+
+    def test_reused_within_a_second(self):
+        """Test that the formatted timestamp changes only when the second does."""
+        with patch("factcheck.verification.service.time.time", side_effect=[100.2, 100.9, 101.0]):
+            first, second, third = _now_iso(), _now_iso(), _now_iso()
+
+        assert first is second
+        assert first == "1970-01-01T00:01:40+00:00"
+        assert third == "1970-01-01T00:01:41+00:00"
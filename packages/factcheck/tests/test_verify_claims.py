@@ -0,0 +1,66 @@
+"""Tests for the claim verification API."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from factcheck.main import verification_service
+from factcheck.verification.google_factcheck import FactCheckResult
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start each test with an empty verification cache."""
+    verification_service.cache.clear()
+
+
+def _claim(claim_id: str, text: str) -> dict[str, str]:
+    return {"claimId": claim_id, "claimText": text, "claimType": "factual"}
+
+
+class TestVerifyClaimsEndpoint:
+    """Tests for the /api/verify-claims endpoint."""
+
+    async def test_verify_claims_preserves_order(self, client):
+        """Test that results are returned per claim in request order."""
+
+        async def search(query: str) -> list[FactCheckResult]:
+            rating = "False" if "flat" in query else "True"
+            return [FactCheckResult(publisher_name="Snopes", url="https://x", rating=rating)]
+
+        with patch.object(verification_service.google_client, "search", side_effect=search):
+            response = await client.post(
+                "/api/verify-claims",
+                json={
+                    "claims": [
+                        _claim("a", "The earth is flat."),
+                        _claim("b", "Water boils at 100C at sea level."),
+                    ]
+                },
+            )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [r["claimId"] for r in results] == ["a", "b"]
+        assert [r["verification"]["status"] for r in results] == ["disputed", "verified"]
+
+    async def test_verify_claims_isolates_failures(self, client):
+        """Test that one failing claim does not fail the batch."""
+        search = AsyncMock(side_effect=[httpx.ConnectError("down"), []])
+
+        with patch.object(verification_service.google_client, "search", search):
+            response = await client.post(
+                "/api/verify-claims",
+                json={"claims": [_claim("a", "First claim."), _claim("b", "Second claim.")]},
+            )
+
+        assert response.status_code == 200
+        statuses = [r["verification"]["status"] for r in response.json()["results"]]
+        assert statuses == ["error", "unverified"]
+
+    async def test_verify_claims_empty(self, client):
+        """Test that an empty batch is rejected."""
+        response = await client.post("/api/verify-claims", json={"claims": []})
+
+        assert response.status_code == 422